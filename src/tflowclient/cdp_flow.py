@@ -43,6 +43,7 @@ import os
 import re
 import stat
 import subprocess
+import sys
 import threading
 import time
 import typing
@@ -112,16 +113,26 @@ class SmsRcReader:
             line_items = line_txt.rstrip("\n").split()
             logger.debug("Credentials found for host=%s with user=%s", *line_items[:2])
             self._smsrc[line_items[0]][line_items[1]] = line_items[2]
+        # host -> credentials (once the prefix search has been done)
+        self._host_credentials = dict()
 
     def get_password(self, host: str, user: str):
         """Return a password for a given **host** and **user** name.
 
         :exception KeyError: If no matching credential is found.
         """
-        for s_host, credentials in self._smsrc.items():
-            if s_host.startswith(host):
-                return credentials[user]
-        raise KeyError(f"No credentials found for host={host:s} and user={user:s}.")
+        credentials = self._host_credentials.get(host)
+        if credentials is None:
+            credentials = next(
+                (c for s_host, c in self._smsrc.items() if s_host.startswith(host)),
+                None,
+            )
+            if credentials is None:
+                raise KeyError(
+                    f"No credentials found for host={host:s} and user={user:s}."
+                )
+            self._host_credentials[host] = credentials
+        return credentials[user]
 
 
 class CdpOutputParserMixin(metaclass=abc.ABCMeta):
@@ -168,6 +179,7 @@ class CdpOutputParserMixin(metaclass=abc.ABCMeta):
         from_suite = False
         current_node = None
         last_matches = []
+        last_nodes = []  # The FlowNode objects associated with last_matches
         if isinstance(output, str):
             output = output.split("\n")
         for line in output:
@@ -191,12 +203,15 @@ class CdpOutputParserMixin(metaclass=abc.ABCMeta):
                             break
                         base_matches.append(p_obj)
                     last_matches = list(base_matches)
-                # Ok, lets process the entry
-                name = m_obj.group(1)
+                    del last_nodes[len(last_matches) :]
+                # Ok, lets process the entry (node names are repeated a lot across
+                # families and refreshes: intern them)
+                name = sys.intern(m_obj.group(1))
                 status = self._STATUS_TRANSLATION[m_obj.group(2)]
                 if len(last_matches) == 0:
                     # This is the suite itself (just check that it's ok)
                     from_suite = name.strip("/") == self.suite
+                    current_node = None
                     if not from_suite:
                         s_name = name.strip("/").split("/")
                         s_suite = self.suite.strip("/").split("/")
@@ -218,13 +233,11 @@ class CdpOutputParserMixin(metaclass=abc.ABCMeta):
                 elif (len(last_matches) >= 2) or (
                     not from_suite and len(last_matches) == 1
                 ):
-                    # This is a usual node
-                    terminal_node = current_node
-                    for item in last_matches[(1 + int(from_suite)) :]:
-                        terminal_node = terminal_node[item.group(1)]
-                    terminal_node.add(name, status)
+                    # This is a usual node (its parent is the last retained node)
+                    current_node = last_nodes[-1].add(name, status)
                 # Retain the match object
                 last_matches.append(m_obj)
+                last_nodes.append(current_node)
         return root_nodes
 
     def _parse_info_outputs(
@@ -231,6 +231,13 @@ class TFlowClientConfig:
         "duplicated" (in seconds)."""
         return float(self._conf.get("ui", "double_keystroke_delay", fallback="0.25"))
 
+    @property
+    def keystroke_debounce_delay(self) -> float:
+        """
+        The delay during which repeated refresh or selection keystrokes are
+        coalesced into a single action (in seconds)."""
+        return float(self._conf.get("ui", "keystroke_debounce_delay", fallback="0.08"))
+
     @property
     def logviewer_command(self) -> list[str]:
         """The command-line launched to visualise logfiles.
@@ -241,6 +248,20 @@ class TFlowClientConfig:
             self._conf.get("ui", "logviewer_command", fallback="vim -R -N {filename:s}")
         )
 
+    @property
+    def logviewer_needs_clear(self) -> bool:
+        """Redraw the whole screen once the log viewer exits.
+
+        This is needed when the log viewer takes over the terminal (the
+        default ``vim`` log viewer does). It may be disabled for log viewers
+        that do not (e.g. a graphical application).
+        """
+        value = self._conf.get("ui", "logviewer_needs_clear", fallback="True")
+        needs_clear = self._true_false_none_value(value)
+        if needs_clear is None:
+            raise ValueError(f"Must be True or False. Not {value!s}.")
+        return needs_clear
+
     @property
     def cdp_timeout(self) -> float | None:
         """The maximum idle time for a CDP client."""
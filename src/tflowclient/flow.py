@@ -98,6 +98,23 @@ class FlowNode(observer.Subject):
 
     """
 
+    # Trees may contain thousands of nodes: no per-instance __dict__
+    __slots__ = (
+        "_name",
+        "_status",
+        "_parent",
+        "_expanded",
+        "_user_expanded",
+        "_flagged",
+        "_flagged_count",
+        "_children",
+        "_root",
+        "_by_status",
+        "_first_expanded_leaf",
+        "_full_path",
+        "_path",
+    )
+
     EXPANDED_STATUSES = {
         FlowStatus.ACTIVE,
         FlowStatus.ABORTED,
@@ -122,7 +139,14 @@ class FlowNode(observer.Subject):
         self._expanded = parent is None  # The first entry is always expanded
         self._user_expanded = None
         self._flagged = False
+        self._flagged_count = 0  # The number of flagged nodes in this sub-tree
         self._children = collections.OrderedDict()
+        self._root = self if parent is None else parent._root
+        # On the tree's root node only: status -> list of all the descendant nodes
+        self._by_status = collections.defaultdict(list) if parent is None else None
+        self._first_expanded_leaf = None  # (FlowNode | None, ) once computed
+        self._full_path = None  # Nodes never move: paths are computed once
+        self._path = None
 
     @property
     def name(self) -> str:
@@ -162,6 +186,11 @@ class FlowNode(observer.Subject):
         """Reset the `user_expanded` property."""
         self._user_expanded = None
 
+    @property
+    def effective_expanded(self) -> bool:
+        """The user's choice if any, otherwise the default ``expanded`` value."""
+        return self._expanded if self._user_expanded is None else self._user_expanded[0]
+
     @property
     def flagged(self):
         """Returns `True` if the present node is selected."""
@@ -173,6 +202,10 @@ class FlowNode(observer.Subject):
         value = bool(value)
         if self._flagged != value:
             self._flagged = bool(value)
+            current = self
+            while current is not None:
+                current._flagged_count += 1 if value else -1
+                current = current.parent
             self._notify({"flagged": self.flagged})
 
     @property
@@ -192,16 +225,28 @@ class FlowNode(observer.Subject):
     @property
     def full_path(self):
         """Return the full path to the requested node."""
-        return self._compute_path()
+        if self._full_path is None:
+            self._full_path = self._compute_path()
+        return self._full_path
 
     @property
     def path(self):
         """Return the path to the requested node (relative to the root node)."""
-        return self._compute_path(with_root=False)
+        if self._path is None:
+            self._path = self._compute_path(with_root=False)
+        return self._path
+
+    def _reset_first_expanded_leaf(self):
+        """internal use: forget the first expanded leaf (here and in all the parents)."""
+        current = self
+        while current is not None:
+            current._first_expanded_leaf = None
+            current = current.parent
 
     def set_expanded_recursively(self):
         """internal use: set the `expanded` on this node and all its parents."""
         self._expanded = True
+        self._first_expanded_leaf = None
         if self.parent is not None:
             self.parent.set_expanded_recursively()
 
@@ -211,18 +256,29 @@ class FlowNode(observer.Subject):
         :param name:  The child node name.
         :param status: The child node status.
         """
-        self._children[name] = FlowNode(name, status, parent=self)
+        child = FlowNode(name, status, parent=self)
+        self._children[name] = child
+        self._root._by_status[status].append(child)
+        self._reset_first_expanded_leaf()
         if status in self.EXPANDED_STATUSES:
-            self._children[name].set_expanded_recursively()
-        return self._children[name]
+            child.set_expanded_recursively()
+        return child
 
     def indented_str(self, level: int):
         """
         Creates a string representation of the current node with a given
         **level** indentation.
         """
-        me = ["{0:s}[{1.status.name:s}]_{1.name:s}".format("  " * level, self)]
-        me.extend([child.indented_str(level + 1) for child in self])
+        me = []
+        todo = [(level, self)]
+        while todo:
+            c_level, node = todo.pop()
+            me.append(
+                "{0:s}[{1.status.name:s}]_{1.name:s}".format("  " * c_level, node)
+            )
+            todo.extend(
+                (c_level + 1, child) for child in reversed(node._children.values())
+            )
         return "\n".join(me)
 
     def __str__(self):
@@ -247,7 +303,7 @@ class FlowNode(observer.Subject):
 
     def __iter__(self) -> typing.Iterator[FlowNode]:
         """Iterates over children."""
-        yield from self._children.values()
+        return iter(self._children.values())
 
     def __len__(self):
         """The number of children."""
@@ -283,16 +339,22 @@ class FlowNode(observer.Subject):
         return None
 
     def first_expanded_leaf(self):
-        """Return the object representing the first expanded leaf in the current tree."""
-        if self.expanded:
-            if len(self) == 0:
-                return self
-            else:
-                for child in self:
-                    e_leaf = child.first_expanded_leaf()
-                    if e_leaf is not None:
-                        return e_leaf
-        return None
+        """Return the object representing the first expanded leaf in the current tree.
+
+        The result is cached until a node is added, or expanded, in the current tree.
+        """
+        if self._first_expanded_leaf is None:
+            e_leaf = None
+            if self.expanded:
+                if len(self) == 0:
+                    e_leaf = self
+                else:
+                    for child in self:
+                        e_leaf = child.first_expanded_leaf()
+                        if e_leaf is not None:
+                            break
+            self._first_expanded_leaf = (e_leaf,)
+        return self._first_expanded_leaf[0]
 
     def _iter_property_paths(self, what: str, path_base: str) -> dict:
         """Internal method: iterate through the nodes tree."""
@@ -309,13 +371,29 @@ class FlowNode(observer.Subject):
         """
         Return a list of paths to objects that are currently ``flagged`` below
         the current node.
+
+        Sub-trees without any flagged node are not visited.
         """
-        flagged = dict()
-        if self.flagged:
-            flagged[""] = True
-        for c_node in self:
-            flagged.update(c_node._iter_property_paths("flagged", ""))
-        return list(flagged.keys())
+        flagged = []
+        if self._flagged_count:
+            if self.flagged:
+                flagged.append("")
+            # Explicit pre-order traversal (children are pushed in reverse order)
+            todo = [
+                (c_node, c_node.name)
+                for c_node in reversed(self._children.values())
+                if c_node._flagged_count
+            ]
+            while todo:
+                node, path = todo.pop()
+                if node.flagged:
+                    flagged.append(path)
+                todo.extend(
+                    (c_node, path + "/" + c_node.name)
+                    for c_node in reversed(node._children.values())
+                    if c_node._flagged_count
+                )
+        return flagged
 
     def user_expanded_paths(self) -> dict[str, tuple[bool, FlowStatus]]:
         """
@@ -346,15 +424,28 @@ class FlowNode(observer.Subject):
         """
         if self.status == status and (not leaf or len(self) == 0):
             self.flagged = True
-        for c_node in self:
-            c_node.flag_status(status)
+        if self._by_status is not None:
+            # On the root node, the descendants are indexed by status
+            for c_node in self._by_status.get(status, ()):
+                if len(c_node) == 0:
+                    c_node.flagged = True
+        else:
+            for c_node in self:
+                c_node.flag_status(status)
 
     def reset_flagged(self):
         """Reset (set to False) the flag of self and all the children nodes (recursively)."""
         if self.flagged:
             self.flagged = False
         for c_node in self:
-            c_node.reset_flagged()
+            if c_node._flagged_count:
+                c_node.reset_flagged()
+
+    def reset_user_expanded(self):
+        """Reset the ``user_expanded`` property of self and all the children nodes (recursively)."""
+        del self.user_expanded
+        for c_node in self:
+            c_node.reset_user_expanded()
 
     def ingest_flagged(self, flagged_paths: list[str]):
         """Import a list of flagged paths."""
@@ -387,6 +478,8 @@ class FlowNode(observer.Subject):
 class RootFlowNode(FlowNode):
     """An extension of the :class:`FlowNode`class that records the creation time."""
 
+    __slots__ = ("_c_time", "_focused")
+
     def __init__(self, name: str, status: FlowStatus):
         """
         :param name: The node's name
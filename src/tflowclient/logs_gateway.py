@@ -91,7 +91,7 @@ class LogsGateway(metaclass=abc.ABCMeta):
         and a datetime object representing the log file modification time (UTC).
         """
         path_logs = re.compile(
-            r"(.*/)?" + re.escape(path.split("/")[-1]) + self._ALLOWED_SUFFIXES
+            r"(.*/)?" + re.escape(path.rpartition("/")[2]) + self._ALLOWED_SUFFIXES
         )
         found = sorted(
             {
@@ -176,7 +176,7 @@ class DemoLogsGateway(StringBasedLogsGateway):
         self, path: str
     ) -> typing.Set[typing.Tuple[str, datetime]]:
         """Generate some fake log names."""
-        basename = path.split("/")[-1]
+        basename = path.rpartition("/")[2]
         # Note: '_some_trash' should be filtered (this is a test)
         return {
             (f"{basename:s}{suffix:s}", datetime(2020, 1, 1, 0, 5 * i, 0))
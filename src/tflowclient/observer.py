@@ -43,6 +43,8 @@ __all__ = ["Subject", "Observer"]
 class Subject:
     """Mixin class for any Observable class."""
 
+    __slots__ = ("_observers",)
+
     def __init__(self):
         """
         No required arguments.
@@ -61,6 +63,10 @@ class Subject:
 
     def _notify(self, info: dict):
         """Notify all of the attached :class:`Observer` object."""
+        if not self._observers:
+            # Most subjects are never observed (e.g. folded nodes): do not pay
+            # for the WeakSet iteration guard
+            return
         for observer in self._observers:
             observer.update_obs_item(self, info)
 
@@ -68,6 +74,8 @@ class Subject:
 class Observer:
     """Abstract class for any observer class."""
 
+    __slots__ = ()
+
     def update_obs_item(self, item: Subject, info: dict):
         """Process the ***info** update triggered by the **item** object."""
         raise NotImplementedError()
@@ -57,7 +57,9 @@ import abc
 import collections
 import contextlib
 from datetime import datetime, timedelta
+import difflib
 import functools
+import itertools
 import logging
 import subprocess
 import time
@@ -83,6 +85,14 @@ _NO_SELECTED_NODE = urwid.Text(
     "No node is currently focused/selected. Please pick one."
 )
 
+#: Used to round the log files age to the second
+_ONE_SECOND = timedelta(seconds=1)
+
+#: The markup of the abbreviated status displayed in front of each node
+_STATUS_MARKUPS = {
+    status: (status.name, f"[{status.name[:3]:s}]") for status in FlowStatus
+}
+
 
 # ------ Urwid Tree Widgets that help to build the statuses tree view ------
 
@@ -92,6 +102,12 @@ class AnyEntryWidget(urwid.TreeWidget, Observer):
 
     indent_cols = 2
 
+    #: The (normal, focused) display attributes depending on the flagged status
+    _FLAGGED_ATTRS = {
+        False: ("treeline", "treeline_f"),
+        True: ("flagged_treeline", "flagged_treeline_f"),
+    }
+
     def __init__(
         self, node: AnyUrwidFlowNode, flow_node: FlowNode, cust_label: str = None
     ):
@@ -112,7 +128,8 @@ class AnyEntryWidget(urwid.TreeWidget, Observer):
 
     def update_obs_item(self, item: FlowNode, info: dict):
         """Deal with node's selection changes."""
-        if isinstance(item, FlowNode) and "flagged" in info:
+        # Only FlowNode objects are observed by this widget
+        if "flagged" in info:
             self.update_w()
 
     def selectable(self) -> bool:
@@ -135,20 +152,15 @@ class AnyEntryWidget(urwid.TreeWidget, Observer):
 
     def update_w(self):
         """Update the attributes of self._w based on the flow_node flagged property."""
-        self._w.attr = ("flagged_" if self._flow_node.flagged else "") + "treeline"
-        self._w.focus_attr = self._w.attr + "_f"
+        attr, focus_attr = self._FLAGGED_ATTRS[self._flow_node.flagged]
+        if self._w.attr != attr:
+            self._w.attr = attr
+            self._w.focus_attr = focus_attr
 
     def get_display_text(self) -> list:
         """The displayed text (including the status)."""
         label = self.get_display_label()
-        return [
-            (
-                self._flow_node.status.name,
-                f"[{self._flow_node.status.name[:3]:s}]",
-            ),
-            " ",
-            label,
-        ]
+        return [_STATUS_MARKUPS[self._flow_node.status], " ", label]
 
     def get_display_label(self) -> str:
         """The node's name."""
@@ -173,9 +185,7 @@ class FamilyTreeWidget(AnyEntryWidget):
         super().__init__(node, flow_node, cust_label=cust_label)
 
         self._folding_keystroke_ts = 0
-        self.expanded = self._flow_node.user_expanded
-        if self.expanded is None:
-            self.expanded = self._flow_node.expanded
+        self.expanded = self._flow_node.effective_expanded
         self.update_expanded_icon()
 
     def reset_folding(self):
@@ -185,13 +195,20 @@ class FamilyTreeWidget(AnyEntryWidget):
         self.update_expanded_icon()
 
     def _recursive_expanded_reset(self, reset_root: AnyEntryWidget):
-        """Recursively update the folding starting from *reset_root*."""
-        my_node = reset_root.get_node()
-        for c_key in my_node.get_child_keys():
-            child_widget = my_node.get_child_widget(c_key)
-            if isinstance(child_widget, FamilyTreeWidget):
-                child_widget.user_set_expanded(self.expanded)
-                self._recursive_expanded_reset(child_widget)
+        """Recursively update the folding starting from *reset_root*.
+
+        An explicit stack is used (rather than recursion) so that very deep
+        trees do not hit Python's recursion limit.
+        """
+        expanded = self.expanded
+        todo = [reset_root.get_node()]
+        while todo:
+            my_node = todo.pop()
+            for c_key in my_node.get_child_keys():
+                child_widget = my_node.get_child_widget(c_key)
+                if isinstance(child_widget, FamilyTreeWidget):
+                    child_widget.user_set_expanded(expanded)
+                    todo.append(child_widget.get_node())
 
     def user_set_expanded(self, expanded):
         """Manually change the expanded attribute."""
@@ -243,41 +260,47 @@ class EmptyWidget(urwid.TreeWidget):
 class FamilyNode(urwid.ParentNode):
     """Metadata storage for families."""
 
-    def __init__(self, flow_node: FlowNode, path: str, parent: FamilyNode = None):
+    def __init__(
+        self,
+        flow_node: FlowNode,
+        path: str,
+        parent: FamilyNode = None,
+        depth: int = None,
+    ):
         """
         :param flow_node: The FlowNode we are working on.
         :param path: The full path to the node.
         :param parent: The parent node (as a Urwid node).
+        :param depth: The node's depth (if already known, the key is then taken
+                      from the **flow_node** name rather than parsed from **path**)
         """
         self.flow_node = flow_node
-        if path == "":
+        if depth is not None:
+            key = flow_node.name if depth else None
+        elif path == "":
             depth = 0
             key = None
         else:
             depth = path.count("/") + 1
-            key = path.split("/")[-1]
-        self._c_keys = collections.OrderedDict()
+            key = path.rpartition("/")[2]
         super().__init__(path, key=key, parent=parent, depth=depth)
 
     def load_parent(self) -> FamilyNode:
         """Create the parent node."""
-        s_path = self.get_value().split("/")
-        parent_name = "/".join(s_path[:-1])
+        parent_name = self.get_value().rpartition("/")[0]
         parent = FamilyNode(self.flow_node.parent, parent_name)
         parent.set_child_node(self.get_key(), self)
         return parent
 
     def load_child_keys(self) -> list[None | str]:
         """The list of children tags (so-called keys in Urwid terminology)."""
-        self._c_keys = collections.OrderedDict()
-        for c in self.flow_node:
-            self._c_keys[c.name] = c
-        if len(self._c_keys) == 0:
+        c_keys = [c.name for c in self.flow_node]
+        if len(c_keys) == 0:
             depth = self.get_depth() + 1
             self._children[None] = EmptyNode("", parent=self, key=None, depth=depth)
             return [None]
         else:
-            return list(self._c_keys.keys())
+            return c_keys
 
     def load_child_node(self, key: str) -> AnyUrwidFlowNode:
         """Create a the Urwid child node object based on the key."""
@@ -285,12 +308,14 @@ class FamilyNode(urwid.ParentNode):
         if key is None:
             return EmptyNode("")
         else:
-            cf_node = self._c_keys[key]
-            c_path = (self.get_value() + "/" if self.get_value() else "") + key
+            cf_node = self.flow_node[key]
+            path = self.get_value()
+            c_path = f"{path:s}/{key:s}" if path else key
+            c_depth = self.get_depth() + 1
             if len(cf_node):
-                return FamilyNode(cf_node, c_path, parent=self)
+                return FamilyNode(cf_node, c_path, parent=self, depth=c_depth)
             else:
-                return TaskNode(cf_node, c_path, parent=self)
+                return TaskNode(cf_node, c_path, parent=self, depth=c_depth)
 
     def load_widget(self) -> FamilyTreeWidget:
         """Load the Urwid widget for self."""
@@ -302,31 +327,47 @@ class FamilyNode(urwid.ParentNode):
             )
 
     def reset_folding_iter(self):
-        """Recursively collapse all children nodes."""
-        self.get_widget().reset_folding()
-        for c_key in self.get_child_keys():
-            self.get_child_node(c_key).reset_folding_iter()
+        """Collapse all the children nodes that were already loaded.
+
+        The other nodes (and widgets) will be created with the default folding
+        anyway.
+        """
+        todo = [self]
+        while todo:
+            f_node = todo.pop()
+            if f_node._widget is not None:
+                f_node._widget.reset_folding()
+            todo.extend(
+                c_node
+                for c_node in f_node._children.values()
+                if isinstance(c_node, FamilyNode)
+            )
 
     def reset_folding(self):
         """Collapse all node (starting from the top of the tree)."""
-        parent = self.get_parent()
-        if parent:
-            parent.reset_folding()
-        else:
-            self.reset_folding_iter()
+        root = self.get_root()
+        root.flow_node.reset_user_expanded()
+        root.reset_folding_iter()
 
 
 class TaskNode(urwid.TreeNode):
     """Metadata storage for individual tasks"""
 
-    def __init__(self, flow_node: FlowNode, path: str, parent: FamilyNode):
+    def __init__(
+        self, flow_node: FlowNode, path: str, parent: FamilyNode, depth: int = None
+    ):
         """
         :param flow_node: The FlowNode we are working on.
         :param path: The full path to the node.
         :param parent: The parent node (as a Urwid node).
+        :param depth: The node's depth (if already known, the key is then taken
+                      from the **flow_node** name rather than parsed from **path**)
         """
-        depth = path.count("/") + 1
-        key = path.split("/")[-1]
+        if depth is None:
+            depth = path.count("/") + 1
+            key = path.rpartition("/")[2]
+        else:
+            key = flow_node.name
         self.flow_node = flow_node
         urwid.TreeNode.__init__(self, path, key=key, parent=parent, depth=depth)
 
@@ -334,15 +375,9 @@ class TaskNode(urwid.TreeNode):
         """Load the Urwid widget for self."""
         return TaskTreeWidget(self, self.flow_node)
 
-    def reset_folding_iter(self):
-        """Nothing to collapse here."""
-        pass
-
     def reset_folding(self):
         """Collapse all node (starting from the top of the tree)."""
-        parent = self.get_parent()
-        if parent:
-            parent.reset_folding()
+        self.get_root().reset_folding()
 
 
 class EmptyNode(urwid.TreeNode):
@@ -397,10 +432,18 @@ class TFlowTreeListBox(urwid.TreeListBox):
 
     @actual_node.setter
     def actual_node(self, value: AnyUrwidFlowNode):
-        """Set the Urwid node being displayed in the widget."""
+        """Set the Urwid node being displayed in the widget.
+
+        When **value** belongs to the tree already displayed, the current walker
+        is re-used (its focus is just moved to **value** if needed).
+        """
+        if value.get_root() is self._actual_node.get_root():
+            if self._actual_walker.get_focus()[1] is not value:
+                self._actual_walker.set_focus(value)
+        else:
+            self._actual_walker = urwid.TreeWalker(value)
         self._actual_node = value
-        self._actual_walker = urwid.TreeWalker(self._actual_node)
-        if not self._void_display:
+        if not self._void_display and self.body is not self._actual_walker:
             self.body = self._actual_walker
 
     @property
@@ -415,9 +458,11 @@ class TFlowTreeListBox(urwid.TreeListBox):
             self._void_display = True
             self.body = self._void_walker
             self._mainloop.draw_screen()
-            yield
-            self.body = self._actual_walker
-            self._void_display = False
+            try:
+                yield
+            finally:
+                self.body = self._actual_walker
+                self._void_display = False
         else:
             yield
 
@@ -493,6 +538,8 @@ class TFlowAbstractView(metaclass=abc.ABCMeta):
         self.header = urwid.Text("")
         self.header_update()
         self.footer = None
+        self._footer_content = None  # What is currently displayed in the footer
+        self._footer_texts = dict()  # Text widgets already built for the footer
         self.footer_update()
         self.main_content = None
 
@@ -509,26 +556,48 @@ class TFlowAbstractView(metaclass=abc.ABCMeta):
         pass
 
     def header_update(self, extra: str = ""):
-        """Update the header text (given any **extra** information)."""
-        self.header.set_text(f"tCDP for {self.flow!s}. {extra:s}")
+        """Update the header text (given any **extra** information).
+
+        The header widget is left alone (i.e. not redrawn) if the text is unchanged.
+        """
+        text = f"tCDP for {self.flow!s}. {extra:s}"
+        if text != self.header.text:
+            self.header.set_text(text)
+
+    def _footer_text_widget(self, markup: list | str) -> urwid.Text:
+        """Return the (memoised) text widget for a given footer **markup**."""
+        # Lists are not hashable
+        m_key = tuple(markup) if isinstance(markup, list) else markup
+        txt = self._footer_texts.get(m_key)
+        if txt is None:
+            txt = urwid.Text(markup)
+            self._footer_texts[m_key] = txt
+        return txt
 
     def footer_update(self, *extras: list):
-        """Update the footer text given a list of command extended by **extras**."""
-        txt_pile = []
-        for extra in extras:
-            txt_pile.append(urwid.Text(extra))
-        for extra in self.footer_text:
-            txt_pile.append(urwid.Text(extra))
+        """Update the footer text given a list of command extended by **extras**.
+
+        Nothing is done if the footer content is unchanged.
+        """
+        footer_content = (extras, list(self.footer_text), self.footer_add_quit)
+        if self.footer is not None and footer_content == self._footer_content:
+            return
+        self._footer_content = footer_content
+        todo = list(extras) + list(self.footer_text)
         if self.footer_add_quit:
-            txt_pile.append(urwid.Text([("key", "Q"), ": Quit"]))
-        max_len = max([len(t.text) for t in txt_pile]) if txt_pile else 1
+            todo.append([("key", "Q"), ": Quit"])
+        txt_pile = [self._footer_text_widget(extra) for extra in todo]
+        max_len = max((len(t.text) for t in txt_pile), default=1)
         if self.footer is None:
             self.footer = urwid.GridFlow(
                 txt_pile, max_len, h_sep=1, v_sep=0, align="left"
             )
         else:
-            self.footer.contents = [(t, self.footer.options()) for t in txt_pile]
-            self.footer.cell_width = max_len
+            if [t for t, _ in self.footer.contents] != txt_pile:
+                options = self.footer.options()
+                self.footer.contents = [(t, options) for t in txt_pile]
+            if self.footer.cell_width != max_len:
+                self.footer.cell_width = max_len
 
     def keypress_hook(self, key: str) -> str | None:
         """Leveraged when used with a :class:`KeyCaptureWrapper` wrapper."""
@@ -555,6 +624,7 @@ class TFlowAbstractCommandView(TFlowAbstractView):
         super().__init__(flow_object, app_object)
         self.root_node = root_node
         self.selected = selected
+        self._selected_text_container = None
         self._todo = None
         if self.root_node is not None and self.selected:
             self.pile = urwid.Pile([])
@@ -575,16 +645,16 @@ class TFlowAbstractCommandView(TFlowAbstractView):
 
     @property
     def selected_text_container(self) -> TFlowLongTextWidget:
-        """The display widget for the list of selected nodes."""
-        radical = [
-            self.flow.suite,
-        ]
-        if self.root_node.full_path:
-            radical.extend(self.root_node.full_path.split("/"))
-        return TFlowLongTextWidget(
-            ["", "Selected nodes:"]
-            + ["/" + "/".join(radical + s.split("/")).strip("/") for s in self.selected]
-        )
+        """The display widget for the list of selected nodes (built once)."""
+        if self._selected_text_container is None:
+            radical = self.flow.suite
+            if self.root_node.full_path:
+                radical += "/" + self.root_node.full_path
+            self._selected_text_container = TFlowLongTextWidget(
+                ["", "Selected nodes:"]
+                + ["/" + (radical + "/" + s).strip("/") for s in self.selected]
+            )
+        return self._selected_text_container
 
     def _do_command(self, command: str):
         """Launch **command** and display the result."""
@@ -604,9 +674,11 @@ class TFlowAbstractCommandView(TFlowAbstractView):
         # Display the result and wait for statuses to be refreshed
         summary = self.flow.command_gateway(command, self.root_node, self.selected)
         text_container = TFlowLongTextWidget(
-            [f'Result for the "{command:s}" command:'] + summary.split("\n")
+            itertools.chain(
+                (f'Result for the "{command:s}" command:',), summary.split("\n")
+            )
         )
-        wait = urwid.Text(
+        wait.set_text(
             ("warning", "Please wait will the statuses are being refreshed...")
         )
         self.pile.contents = [
@@ -655,6 +727,20 @@ class TFlowCommandView(TFlowAbstractCommandView):
         ("Requeue", "0", "requeue"),
     ]
 
+    #: Map each keyboard shortcut to its command
+    _shortcuts_map = {av_c[1]: av_c[2] for av_c in available_commands if av_c[1]}
+
+    #: The list of keyboard shortcuts, as displayed in the footer
+    _shortcuts_display = "/".join(_shortcuts_map)
+
+    #: The (label, command) pairs of the commands' buttons
+    _commands_labels = [
+        ("[{1:s}] {0:s}".format(*av_c), av_c[2]) for av_c in available_commands
+    ]
+
+    #: The width of the commands' buttons
+    _commands_cell_width = max(len(label) for label, _ in _commands_labels) + 4
+
     def __init__(
         self,
         flow_object: FlowInterface,
@@ -690,10 +776,7 @@ class TFlowCommandView(TFlowAbstractCommandView):
         self.pile.focus_position = 0
         self.footer_update(
             [
-                (
-                    "key",
-                    "/".join([av_c[1] for av_c in self.available_commands if av_c[1]]),
-                ),
+                ("key", self._shortcuts_display),
                 ": launch the command",
             ],
             [("key", "ESC/BACKSPACE"), ": back to statuses"],
@@ -708,22 +791,20 @@ class TFlowCommandView(TFlowAbstractCommandView):
 
     def _commands_grid(self) -> urwid.GridFlow:
         """Generate the list of Urwid buttons associated with each of the commands."""
-        buttons = []
-        label_sizes = []
-        for av_c in self.available_commands:
-            label = "[{1:s}] {0:s}".format(*av_c)
-            label_sizes.append(len(label))
-            buttons.append(
-                urwid.AttrWrap(
-                    urwid.Button(
-                        label, on_press=self._button_pressed, user_data=av_c[2]
-                    ),
-                    "button",
-                    "button_f",
-                )
+        buttons = [
+            urwid.AttrWrap(
+                urwid.Button(label, on_press=self._button_pressed, user_data=command),
+                "button",
+                "button_f",
             )
+            for label, command in self._commands_labels
+        ]
         return urwid.GridFlow(
-            buttons, cell_width=max(label_sizes) + 4, h_sep=2, v_sep=0, align="left"
+            buttons,
+            cell_width=self._commands_cell_width,
+            h_sep=2,
+            v_sep=0,
+            align="left",
         )
 
     def _button_pressed(self, button: urwid.Button, user_data: str):
@@ -735,10 +816,10 @@ class TFlowCommandView(TFlowAbstractCommandView):
         self.flow.refresh(self.root_node.name, force=True)
 
     def _selected_keypress_hook(self, key: str) -> str | None:
-        for av_c in self.available_commands:
-            if av_c[1] and key.upper() == av_c[1]:
-                self._do_command(av_c[2])
-                return
+        command = self._shortcuts_map.get(key.upper())
+        if command is not None:
+            self._do_command(command)
+            return
         return key
 
 
@@ -792,11 +873,14 @@ class TFlowLogsView(TFlowAbstractView):
         flow_object: FlowInterface,
         app_object: TFlowApplication,
         root_node: RootFlowNode | None,
+        wait_display: typing.Callable[[], typing.ContextManager] = None,
     ):
         """
         :param flow_object: The flow object currently being used
         :param app_object: The application object
         :param root_node: The current active root FlowNode
+        :param wait_display: A context manager factory that displays a wait
+                             message while the log files are being listed
         """
         super().__init__(flow_object, app_object)
         self.focused_node = None
@@ -816,7 +900,9 @@ class TFlowLogsView(TFlowAbstractView):
             )
         else:
             try:
-                av_listings = self.flow.logs.list_file(self.focused_path)
+                # Listing the log files may take a while: display a wait message
+                with (wait_display or contextlib.nullcontext)():
+                    av_listings = self.flow.logs.list_file(self.focused_path)
             except LogsGatewayRuntimeError as e:
                 # This step may fail (network problems, ...)
                 self.text_container = urwid.Text(
@@ -843,14 +929,10 @@ class TFlowLogsView(TFlowAbstractView):
                     )
                     cur_time = datetime.utcnow()
                     for listing in av_listings:
-                        l_label = "{:s} ({!s} ago)".format(
-                            listing[0].split("/")[-1],
-                            timedelta(
-                                seconds=(
-                                    (cur_time - listing[1]) // timedelta(seconds=1)
-                                )
-                            ),
+                        l_age = timedelta(
+                            seconds=(cur_time - listing[1]) // _ONE_SECOND
                         )
+                        l_label = f"{listing[0].rpartition('/')[2]:s} ({l_age!s} ago)"
                         self.buttons.append(
                             urwid.AttrWrap(
                                 urwid.Button(
@@ -915,8 +997,9 @@ class TFlowLogsView(TFlowAbstractView):
                 self.focused_path,
                 e,
             )
-        # Redraw the whole screen (because, vim will have messed things up...)
-        self.app.loop.screen.clear()
+        if tflowclient_conf.logviewer_needs_clear:
+            # Redraw the whole screen (because, vim will have messed things up...)
+            self.app.loop.screen.clear()
 
     def keypress_hook(self, key: str) -> str | None:
         """Handle key strokes."""
@@ -1020,7 +1103,7 @@ class TFlowInfoView(TFlowAbstractView):
     @property
     def touched(self):
         """Tells whether some of the fields have changed."""
-        return any([i.touched for i in self._info])
+        return any(i.touched for i in self._info)
 
     def _refresh_footer(self):
         """Add the entry related to "ENTER" only when sensible."""
@@ -1034,10 +1117,11 @@ class TFlowInfoView(TFlowAbstractView):
             todo.append([("key", "ENTER"), ": save & go back"])
         self.footer_update(*todo)
 
+    # noinspection PyUnusedLocal
     def _update_value(
         self, item: ExtraFlowNodeInfo, widget: urwid.Edit, old_value: str
     ):
-        assert isinstance(old_value, str)
+        """Record the new value of **item** (called on every edit)."""
         item.value = widget.edit_text
         self._refresh_footer()
 
@@ -1071,8 +1155,14 @@ class TFlowInfoView(TFlowAbstractView):
                     self.pile.contents = [
                         (
                             TFlowLongTextWidget(
-                                ["", "Output received when changing the settings:", ""]
-                                + self._result.split("\n")
+                                itertools.chain(
+                                    (
+                                        "",
+                                        "Output received when changing the settings:",
+                                        "",
+                                    ),
+                                    self._result.split("\n"),
+                                )
                             ),
                             ("weight", 1),
                         )
@@ -1106,10 +1196,8 @@ class TFlowQuitView(TFlowAbstractView):
         # Add the Yes/No buttons
         self._inner_g_flow = urwid.GridFlow(
             [
-                urwid.AttrWrap(
-                    urwid.Button(name, self.button_press), "button", "button_f"
-                )
-                for name in ("Yes", "No")
+                urwid.AttrWrap(urwid.Button(name, on_press), "button", "button_f")
+                for name, on_press in (("Yes", self._on_yes), ("No", self._on_no))
             ],
             cell_width=7,
             h_sep=3,
@@ -1129,19 +1217,56 @@ class TFlowQuitView(TFlowAbstractView):
         """Forget about the previous view."""
         self.previous_view = None
 
-    def button_press(self, button: urwid.Button):
-        """Exit or go back to the previous view."""
-        if button.label == "Yes":
-            raise urwid.ExitMainLoop
-        else:
-            self.app.switch_view(self.previous_view)
+    # noinspection PyUnusedLocal
+    def _on_yes(self, button: urwid.Button):
+        """Exit."""
+        raise urwid.ExitMainLoop
+
+    # noinspection PyUnusedLocal
+    def _on_no(self, button: urwid.Button):
+        """Go back to the previous view."""
+        self.app.switch_view(self.previous_view)
 
     def footer_update(self, *extras: list):
         """Empty the footer text."""
         self.footer = urwid.GridFlow([], 1, h_sep=2, v_sep=0, align="left")
 
 
-class TFlowCancelMainView(TFlowAbstractView, Observer):
+class TFlowAbstractAgeView(TFlowAbstractView):
+    """Common things for views that display the information age in their header."""
+
+    timer_interval = 1
+
+    def __init__(self, flow_object: FlowInterface, app_object: TFlowApplication):
+        """
+        :param flow_object: The flow object currently being used
+        :param app_object: The application object
+        """
+        super().__init__(flow_object, app_object)
+        self._timer = None
+        self._timer_paused = False  # The age updater is paused while hidden
+
+    @abc.abstractmethod
+    def age_auto_update(self, current_loop: urwid.MainLoop, user_data=None):
+        """Update the header with the information age and re-arm the timer."""
+        raise NotImplementedError()
+
+    def switch_in_hook(self):
+        """Resume the age updater (if it was paused)."""
+        if self._timer_paused:
+            self._timer_paused = False
+            if self._timer is None:
+                self.age_auto_update(self.app.loop)
+
+    def switch_out_hook(self):
+        """Pause the age updater: the header is not visible anymore."""
+        if self._timer is not None:
+            self.app.loop.remove_alarm(self._timer)
+            self._timer = None
+            self._timer_paused = True
+
+
+class TFlowCancelMainView(TFlowAbstractAgeView, Observer):
     """The application' main view (statuses tree)."""
 
     footer_text = [
@@ -1152,16 +1277,13 @@ class TFlowCancelMainView(TFlowAbstractView, Observer):
         [("key", "C"), ": Cancel selected"],
     ]
 
-    timer_interval = 1
-
     def __init__(self, flow_object: FlowInterface, app_object: TFlowApplication):
         """
         :param flow_object: The flow object currently being used
         :param app_object: The application object
         """
         super().__init__(flow_object, app_object)
-        # Populate the root nodes list and display the first item in the tree widget
-        self._timer = None
+        self._roots_boxes = dict()  # name -> (status, CheckBox)
         # The wait screen...
         self.main_wait = KeyCaptureWrapper(
             urwid.Padding(urwid.Filler(_SERVER_WAIT_TEXT), left=1, right=1),
@@ -1255,32 +1377,37 @@ class TFlowCancelMainView(TFlowAbstractView, Observer):
             self.app.loop.remove_alarm(self._timer)
             self.header_update()
             self._timer = None
-        # Update the root nodes list
+        # Update the root nodes list (existing check boxes are re-used, so that
+        # their checked state is preserved)
+        tree_roots = self.flow.tree_roots
         g_flow_focused = self.focused_node_name
-        g_flow_checked = set(self.selected_nodes_names)
-        g_flow_opts = self.grid_flow.options()
-        self.grid_flow.contents.clear()
-        self.grid_flow.contents.extend(
-            [
-                (urwid.CheckBox((tr.status.name, tr.name)), g_flow_opts)
-                for tr in sorted(self.flow.tree_roots, key=lambda tr: tr.name)
-            ]
-        )
-        self.grid_flow.cell_width = 4 + max(
-            [len(tr.name) for tr in self.flow.tree_roots]
-        )
-        # Preserve the focused/checked node
-        for i_box, c_box in enumerate(self.grid_flow.contents):
-            if c_box[0].label == g_flow_focused:
-                self.grid_flow.set_focus(i_box)
-            if c_box[0].label in g_flow_checked:
-                c_box[0].state = True
-        if g_flow_focused is None or g_flow_focused not in self.flow.tree_roots:
+        roots_boxes = dict()
+        for tr in sorted(tree_roots, key=lambda tr: tr.name):
+            status, c_box = self._roots_boxes.get(tr.name, (None, None))
+            if c_box is None:
+                c_box = urwid.CheckBox((tr.status.name, tr.name))
+            elif status is not tr.status:
+                c_box.set_label((tr.status.name, tr.name))
+            roots_boxes[tr.name] = (tr.status, c_box)
+        self._roots_boxes = roots_boxes
+        c_boxes = [c_box for _, c_box in roots_boxes.values()]
+        if [c[0] for c in self.grid_flow.contents] != c_boxes:
+            g_flow_opts = self.grid_flow.options()
+            self.grid_flow.contents = [(c_box, g_flow_opts) for c_box in c_boxes]
+        cell_width = 4 + max(len(tr.name) for tr in tree_roots)
+        if self.grid_flow.cell_width != cell_width:
+            self.grid_flow.cell_width = cell_width
+        # Preserve the focused node
+        if g_flow_focused is None or g_flow_focused not in roots_boxes:
             self.grid_flow.set_focus(0)
-        self._timer = self.app.loop.set_alarm_in(
-            self.timer_interval, self.age_auto_update
-        )
-        logger.debug("Timer for age update is: %s", self._timer)
+        else:
+            self.grid_flow.set_focus(list(roots_boxes).index(g_flow_focused))
+        # Restart the age updater (unless the view is hidden: switch_in_hook will)
+        if not self._timer_paused:
+            self._timer = self.app.loop.set_alarm_in(
+                self.timer_interval, self.age_auto_update
+            )
+            logger.debug("Timer for age update is: %s", self._timer)
 
     # noinspection PyUnusedLocal
     def age_auto_update(self, current_loop: urwid.MainLoop, user_data=None):
@@ -1306,7 +1433,7 @@ class TFlowCancelMainView(TFlowAbstractView, Observer):
         self.app.switch_view(l_view)
 
 
-class TFlowMainView(TFlowAbstractView, Observer):
+class TFlowMainView(TFlowAbstractAgeView, Observer):
     """The application' main view (statuses tree)."""
 
     footer_text = [
@@ -1322,9 +1449,28 @@ class TFlowMainView(TFlowAbstractView, Observer):
         [("key", "I"), ": Node Info"],
     ]
 
+    #: Keyboard shortcuts (lower and upper case) and the matching method names
+    _KEY_HANDLERS = {
+        k: handler
+        for key, handler in (
+            ("r", "flow_refresh"),
+            ("d", "reset_folding"),
+            ("f", "fold_first_level"),
+            ("c", "command_dialog"),
+            ("l", "logs_dialog"),
+            ("i", "info_dialog"),
+            ("a", "flag_aborted"),
+            ("u", "reset_flagged"),
+        )
+        for k in (key, key.upper())
+    }
+
+    #: The actions that are deferred (and coalesced if the key is hit repeatedly)
+    _DEBOUNCED_HANDLERS = {"flow_refresh", "flag_aborted", "reset_flagged"}
+
     recent_roots_threshold = 3 * 3600
 
-    timer_interval = 1
+    tree_nodes_cache_size = 8
 
     def __init__(self, flow_object: FlowInterface, app_object: TFlowApplication):
         """
@@ -1345,19 +1491,27 @@ class TFlowMainView(TFlowAbstractView, Observer):
         self.listbox = TFlowTreeListBox(void_node, void_node, mainloop=self.app.loop)
         # Display the various root nodes
         self.roots_walker = urwid.SimpleFocusListWalker([])
+        self._roots_entries = []  # The (status, name) entries in roots_walker
+        self._roots_radio_group = []
         self._roots_hits = dict()  # Keep track of root nodes last access time
+        self._roots_signature = None  # What is currently displayed in roots_walker
+        self._roots_col_width = 0
+        self.main_columns = None
         # Current active root node
         self._active_root = None
-        self._active_root_timer = None
+        self._active_root_node = None  # (name, RootFlowNode) cache
+        self._last_focus_pos = None
+        # Deferred keyboard action
+        self._debounced_handler = None
+        self._debounced_alarm = None
+        # root name -> (RootFlowNode, Urwid node)
+        self._tree_nodes = collections.OrderedDict()
         # Populate the root nodes list and display the first item in the tree widget
         self.update_flow_roots()
         # Create the appropriate layout (root nodes on the left, tree on the right)
         self.main_columns = urwid.Columns(
             [
-                (
-                    4 + max([len(r.name) for r in self.flow.tree_roots]),
-                    urwid.ListBox(self.roots_walker),
-                ),
+                (self._roots_col_width, urwid.ListBox(self.roots_walker)),
                 self.listbox,
             ],
             dividechars=2,
@@ -1370,11 +1524,13 @@ class TFlowMainView(TFlowAbstractView, Observer):
         """Listen to the FlowInterface and update the UI accordingly"""
         if "tree_roots" in info:
             logger.debug('Tree root change notified by "%r"', item)
+            self._active_root_node = None
             self.update_flow_roots()
         if "full_status" in info:
             path = info["full_status"]["path"]
             logger.debug('Status change notified by "%r" for "%s"', item, path)
             if path == self.active_root:
+                self._active_root_node = None
                 self.update_tree(self.active_root)
 
     @property
@@ -1387,11 +1543,6 @@ class TFlowMainView(TFlowAbstractView, Observer):
         """Setter for the current active root node"""
         if value != self._active_root:
             logger.debug('Switching the active node to "%s".', value)
-            # Stop updating the tree age
-            if self._active_root_timer is not None:
-                logger.debug("Cancelling active timer: %s", self._active_root_timer)
-                self.app.loop.remove_alarm(self._active_root_timer)
-                self._active_root_timer = None
             # Stop tracking the focus (does nothing if not sensible)
             urwid.disconnect_signal(
                 self.listbox.actual_walker, "modified", self.update_focused_node
@@ -1403,7 +1554,15 @@ class TFlowMainView(TFlowAbstractView, Observer):
     def active_root_node(self) -> RootFlowNode | None:
         """Return the current active root FlowNode object."""
         if self.active_root:
-            return self.flow.full_status(self.active_root)
+            # The cache is invalidated when the FlowInterface notifies changes
+            if self._active_root_node is None or (
+                self._active_root_node[0] != self.active_root
+            ):
+                self._active_root_node = (
+                    self.active_root,
+                    self.flow.full_status(self.active_root),
+                )
+            return self._active_root_node[1]
         else:
             return None
 
@@ -1414,84 +1573,156 @@ class TFlowMainView(TFlowAbstractView, Observer):
 
     def keypress_hook(self, key: str) -> str | None:
         """Handle key strokes."""
-        if key in ("r", "R"):
-            self.flow_refresh()
-        elif key in ("d", "D"):
-            self.reset_folding()
-        elif key in ("f", "F"):
-            self.fold_first_level()
-        elif key in ("c", "C"):
-            self.command_dialog()
-        elif key in ("l", "L") and self.flow.logs is not None:
-            self.logs_dialog()
-        elif key in ("i", "I"):
-            self.info_dialog()
-        elif key in ("a", "A"):
-            logger.debug(
-                'Aborted tasks selection triggered by user on "%s".', self.active_root
-            )
-            self.active_root_node.reset_flagged()
-            self.active_root_node.flag_status(FlowStatus.ABORTED)
-        elif key in ("u", "U"):
-            logger.debug(
-                'Global un-select triggered by user on "%s".', self.active_root
-            )
-            self.active_root_node.reset_flagged()
-        else:
+        handler = self._KEY_HANDLERS.get(key)
+        if handler == "logs_dialog" and self.flow.logs is None:
+            handler = None
+        if handler != self._debounced_handler:
+            # Any other key stroke: the deferred action must be carried out first
+            self.flush_debounced_action()
+        if handler is None:
             return key
+        if handler in self._DEBOUNCED_HANDLERS:
+            if self._debounced_alarm is None:
+                self._debounced_handler = handler
+                self._debounced_alarm = self.app.loop.set_alarm_in(
+                    tflowclient_conf.keystroke_debounce_delay,
+                    self.flush_debounced_action,
+                )
+        else:
+            getattr(self, handler)()
 
-    def _radio_buttons_list(
-        self, b_group: list, active: str, roots: list[FlowNode]
-    ) -> list[urwid.RadioButton]:
-        return [
-            urwid.RadioButton(
-                b_group,
-                (tr.status.name, tr.name),
-                state=(tr.name == active) if active is not None else "first True",
+    # noinspection PyUnusedLocal
+    def flush_debounced_action(
+        self, current_loop: urwid.MainLoop = None, user_data=None
+    ):
+        """Carry out the deferred keyboard action (if any)."""
+        if self._debounced_alarm is not None:
+            if current_loop is None:
+                # Not called by the alarm itself: it is no longer needed
+                self.app.loop.remove_alarm(self._debounced_alarm)
+            handler = self._debounced_handler
+            self._debounced_alarm = None
+            self._debounced_handler = None
+            getattr(self, handler)()
+
+    def flag_aborted(self):
+        """Select the aborted tasks (and only them)."""
+        logger.debug(
+            'Aborted tasks selection triggered by user on "%s".', self.active_root
+        )
+        self.active_root_node.reset_flagged()
+        self.active_root_node.flag_status(FlowStatus.ABORTED)
+
+    def reset_flagged(self):
+        """Un-select all of the nodes."""
+        logger.debug('Global un-select triggered by user on "%s".', self.active_root)
+        self.active_root_node.reset_flagged()
+
+    def _roots_entry_widget(
+        self, entry: tuple[str, str] | None, reusable: dict[str, urwid.RadioButton]
+    ) -> urwid.Widget:
+        """Create the left column widget that represents a given **entry**.
+
+        If available, a radio button is picked in the **reusable** dictionary.
+        """
+        if entry is None:
+            return urwid.Text("-")
+        elif entry[1] in reusable:
+            button = reusable.pop(entry[1])
+            button.set_label(entry)
+            return button
+        else:
+            return urwid.RadioButton(
+                self._roots_radio_group,
+                entry,
+                state=False,
                 on_state_change=self.update_root_choice,
             )
-            for tr in roots
-        ]
 
     def update_flow_roots(self):
         """Update the list of root nodes (aka Tree roots)."""
+        tree_roots = self.flow.tree_roots
         active = None
-        if self.active_root and self.active_root in self.flow.tree_roots:
+        if self.active_root and self.active_root in tree_roots:
             # keep track of the current active root Node
             active = self.active_root
-        # Order the root nodes given several criteria
-        current_time = time.monotonic()
-        recent_roots = []
-        other_roots = []
-        for root_node in self.flow.tree_roots:
-            age = current_time - self._roots_hits.get(
-                root_node.name, -self.recent_roots_threshold
-            )
-            if age >= self.recent_roots_threshold:
-                other_roots.append(root_node)
-            else:
-                recent_roots.append(root_node)
-        recent_roots.sort(key=lambda x: x.name)
-        other_roots.sort(key=lambda x: (x.status.value, x.name))
-        # Create the list of buttons representing the various root nodes
-        roots_radio_group = []
+        # Forget about the root nodes that were not visited recently
+        cutoff = time.monotonic() - self.recent_roots_threshold
+        for name in [n for n, hit in self._roots_hits.items() if hit <= cutoff]:
+            del self._roots_hits[name]
+        # Extract what matters for each root node in a single pass:
+        # (name, status, recently visited)
+        roots_rows = tuple(
+            (root_node.name, root_node.status, root_node.name in self._roots_hits)
+            for root_node in tree_roots
+        )
+        # If nothing changed since the last update, leave the left column alone
+        roots_signature = (active, roots_rows)
+        if roots_signature == self._roots_signature:
+            logger.debug("No changes in the root nodes list. Skipping the update.")
+            return
+        self._roots_signature = roots_signature
+        # The left column width only changes with the root nodes names
+        roots_col_width = 4 + max(len(name) for name, _, _ in roots_rows)
+        if roots_col_width != self._roots_col_width:
+            self._roots_col_width = roots_col_width
+            if self.main_columns is not None:
+                self.main_columns.contents[0] = (
+                    self.main_columns.contents[0][0],
+                    self.main_columns.options("given", roots_col_width),
+                )
+        # Order the root nodes given several criteria (the sort keys are built
+        # once and root node names are unique, so plain tuples comparisons do)
+        recent_roots = sorted(
+            (name, status.name) for name, status, recent in roots_rows if recent
+        )
+        other_roots = sorted(
+            (status.value, name, status.name)
+            for name, status, recent in roots_rows
+            if not recent
+        )
+        # The list of entries (status, name) representing the various root nodes
         entries = (
-            self._radio_buttons_list(roots_radio_group, active, recent_roots)
-            + [urwid.Text("-")]
-            + self._radio_buttons_list(roots_radio_group, active, other_roots)
+            [(status, name) for name, status in recent_roots]
+            + [None]
+            + [(status, name) for _, name, status in other_roots]
         )
         # If there is no active root node: active the first root node
         if active is None:
-            self.active_root = (recent_roots + other_roots)[0].name
-        # Update the left column (root nodes widget)
-        self.roots_walker.clear()
-        self.roots_walker.extend(entries)
-        active_index = [b.state for b in roots_radio_group].index(True)
-        self.roots_walker.set_focus(active_index)
+            self.active_root = next(entry[1] for entry in entries if entry is not None)
+            self._roots_signature = (self.active_root, roots_signature[1])
+        # Update the left column (root nodes widget): only the modified entries
+        # are replaced
+        e_matcher = difflib.SequenceMatcher(
+            a=self._roots_entries, b=entries, autojunk=False
+        )
+        e_changes = [op for op in e_matcher.get_opcodes() if op[0] != "equal"]
+        # Radio buttons that are just moving around are not re-created
+        reusable = {b.get_label(): b for b in self._roots_radio_group}
+        for _, i_start, i_end, j_start, j_end in reversed(e_changes):
+            self.roots_walker[i_start:i_end] = [
+                self._roots_entry_widget(entry, reusable)
+                for entry in entries[j_start:j_end]
+            ]
+        self._roots_entries = entries
+        self._roots_radio_group[:] = [
+            w for w in self.roots_walker if isinstance(w, urwid.RadioButton)
+        ]
+        for button in self._roots_radio_group:
+            button.set_state(button.get_label() == self.active_root, do_callback=False)
+        if e_changes:
+            active_index = next(
+                i_entry
+                for i_entry, entry in enumerate(entries)
+                if entry is not None and entry[1] == self.active_root
+            )
+            self.roots_walker.set_focus(active_index)
 
     def update_root_choice(self, button: urwid.RadioButton, root: str):
         """Triggered when the user selects a new root Node."""
         if root:
+            # Deferred actions apply to the previous root node
+            self.flush_debounced_action()
             new_active_root = button.get_label()
             with self.listbox.temporary_void_display():
                 self.flow.refresh(new_active_root)
@@ -1503,24 +1734,31 @@ class TFlowMainView(TFlowAbstractView, Observer):
 
     def update_focused_node(self):
         """Keep track of the focused flow node."""
-        f_node = self.listbox.actual_walker.get_focus()[1].flow_node
+        focus_pos = self.listbox.actual_walker.get_focus()[1]
+        if focus_pos is self._last_focus_pos:
+            # The walker was modified but the focus did not move
+            return
+        self._last_focus_pos = focus_pos
+        f_node = focus_pos.flow_node
         if f_node is not None:
             self.active_root_node.focused = f_node
 
-    def age_auto_update(self, current_loop: urwid.MainLoop, registered_root: str):
-        """Increment the root Node age."""
-        self._active_root_timer = None
-        if self.active_root == registered_root:
-            try:
-                root_f_node = self.active_root_node
-            except ValueError:
-                # If the tree root does not exists anymore in the scheduler...
-                root_f_node = None
-            if root_f_node is not None:
-                self.header_update(f"Information is {root_f_node.age:.0f} seconds old.")
-                self._active_root_timer = current_loop.set_alarm_in(
-                    self.timer_interval, self.age_auto_update, user_data=registered_root
-                )
+    # noinspection PyUnusedLocal
+    def age_auto_update(self, current_loop: urwid.MainLoop, user_data=None):
+        """Increment the active root Node age.
+
+        A single timer is used whatever the active root node is.
+        """
+        try:
+            root_f_node = self.active_root_node
+        except ValueError:
+            # If the tree root does not exists anymore in the scheduler...
+            root_f_node = None
+        if root_f_node is not None:
+            self.header_update(f"Information is {root_f_node.age:.0f} seconds old.")
+        self._timer = current_loop.set_alarm_in(
+            self.timer_interval, self.age_auto_update
+        )
 
     def update_tree(self, root: str):
         """Display the **root** node in the Tree widget."""
@@ -1538,37 +1776,64 @@ class TFlowMainView(TFlowAbstractView, Observer):
             focused_node = root_f_node
         if focused_node is not None:
             root_f_node.focused = focused_node
-        # Ok, let's update the TreeView
-        if len(focused_node) or focused_node.parent is None:
-            self.listbox.actual_node = FamilyNode(focused_node, focused_node.path)
-        else:
-            self.listbox.actual_node = TaskNode(
-                focused_node,
-                focused_node.path,
-                FamilyNode(focused_node.parent, focused_node.parent.path),
-            )
+        # Ok, let's update the TreeView (the previous walker is discarded: stop
+        # listening to it)
+        urwid.disconnect_signal(
+            self.listbox.actual_walker, "modified", self.update_focused_node
+        )
+        self.listbox.actual_node = self._tree_node(root, root_f_node, focused_node)
         # Keep track of the focused node
+        self._last_focus_pos = self.listbox.actual_node
         urwid.connect_signal(
             self.listbox.actual_walker, "modified", self.update_focused_node
         )
-        logger.debug(
-            'Tree updated for "%s" (information is %f seconds old). Focusing "%s".',
-            root,
-            root_f_node.age,
-            focused_node.path,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Tree updated for "%s" (information is %f seconds old). Focusing "%s".',
+                root,
+                root_f_node.age,
+                focused_node.path,
+            )
         # Display the Root node age
         self.header_update(f"Information is {root_f_node.age:.0f} seconds old.")
-        # Start an age updater if needed
-        if self._active_root_timer is None:
-            self._active_root_timer = self.app.loop.set_alarm_in(
-                self.timer_interval,
-                self.age_auto_update,
-                user_data=root,
+        # Start the age updater if needed (unless the view is hidden:
+        # switch_in_hook will)
+        if self._timer is None and not self._timer_paused:
+            self._timer = self.app.loop.set_alarm_in(
+                self.timer_interval, self.age_auto_update
             )
-            logger.debug(
-                "Timer for age update is: %s (for %s)", self._active_root_timer, root
+            logger.debug("Timer for age update is: %s", self._timer)
+
+    def _tree_node(
+        self, root: str, root_f_node: RootFlowNode, focused_node: FlowNode
+    ) -> AnyUrwidFlowNode:
+        """Return the Urwid node that represents **focused_node**.
+
+        The Urwid nodes (and therefore their widgets) created for a given
+        **root** are re-used as long as its statuses tree is unchanged.
+        """
+        cached = self._tree_nodes.get(root)
+        if cached is not None and cached[0] is root_f_node:
+            self._tree_nodes.move_to_end(root)
+            urwid_node = cached[1].get_root()
+            if focused_node.path:
+                for key in focused_node.path.split("/"):
+                    urwid_node.get_child_keys()
+                    urwid_node = urwid_node.get_child_node(key)
+            return urwid_node
+        if len(focused_node) or focused_node.parent is None:
+            urwid_node = FamilyNode(focused_node, focused_node.path)
+        else:
+            urwid_node = TaskNode(
+                focused_node,
+                focused_node.path,
+                FamilyNode(focused_node.parent, focused_node.parent.path),
             )
+        self._tree_nodes[root] = (root_f_node, urwid_node)
+        self._tree_nodes.move_to_end(root)
+        if len(self._tree_nodes) > self.tree_nodes_cache_size:
+            self._tree_nodes.popitem(last=False)
+        return urwid_node
 
     def flow_refresh(self):
         """Refresh all the data."""
@@ -1596,8 +1861,9 @@ class TFlowMainView(TFlowAbstractView, Observer):
             child_widget.user_set_expanded(False)
         # Select the closest level 1 node (to be consistent with the new folding)
         _, focused_node = self.listbox.actual_walker.get_focus()
-        if focused_node.get_depth() > 1:
-            while focused_node.get_depth() > 1:
+        depth = focused_node.get_depth()
+        if depth > 1:
+            for _ in range(depth - 1):
                 focused_node = focused_node.get_parent()
             self.listbox.actual_walker.set_focus(focused_node)
 
@@ -1616,7 +1882,12 @@ class TFlowMainView(TFlowAbstractView, Observer):
         """Open the log files view dialog"""
         logger.debug('Logs dialog requested by user on "%s".', self.active_root)
         if self.focused_tree:
-            l_view = TFlowLogsView(self.flow, self.app, root_node=self.active_root_node)
+            l_view = TFlowLogsView(
+                self.flow,
+                self.app,
+                root_node=self.active_root_node,
+                wait_display=self.listbox.temporary_void_display,
+            )
         else:
             l_view = TFlowLogsView(self.flow, self.app, root_node=None)
         self.app.switch_view(l_view)
@@ -1654,6 +1925,10 @@ class TFlowApplication:
             raise ValueError(f'Unauthorised "app_name" value: {app_name:s}')
         # Create the Frame widget that will be used in the whole application
         self.view = urwid.Frame(urwid.Filler(urwid.Text("Initialising...")))
+        # The header and footer wrappers (created by the first switch_view and
+        # then kept: only their content changes)
+        self._header_wrap = None
+        self._footer_wrap = None
         # Create the main loop
         screen = (
             urwid.curses_display.Screen()
@@ -1668,10 +1943,11 @@ class TFlowApplication:
                 "Creating the urwid main loop. Terminal properties: %s", t_properties
             )
         palette = tflowclient_conf.palette
-        logger.debug(
-            "Creating the urwid main loop. Palette is:\n  %s",
-            "\n  ".join([str(item) for item in palette]),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Creating the urwid main loop. Palette is:\n  %s",
+                "\n  ".join([str(item) for item in palette]),
+            )
         self.loop = urwid.MainLoop(
             self.view,
             palette,
@@ -1691,13 +1967,21 @@ class TFlowApplication:
     # noinspection PyArgumentList
     def switch_view(self, view_obj: TFlowAbstractView):
         """Display the **view_obj** view."""
+        if view_obj is self.current_view:
+            return
         logger.debug('Switching to view: "%s"', view_obj)
         if self.current_view is not None:
             self.current_view.switch_out_hook()
         view_obj.switch_in_hook()
         self.view.set_body(view_obj.main_content)
-        self.view.set_header(urwid.AttrWrap(view_obj.header, "head"))
-        self.view.set_footer(urwid.AttrWrap(view_obj.footer, "foot"))
+        if self._header_wrap is None:
+            self._header_wrap = urwid.AttrWrap(view_obj.header, "head")
+            self._footer_wrap = urwid.AttrWrap(view_obj.footer, "foot")
+            self.view.set_header(self._header_wrap)
+            self.view.set_footer(self._footer_wrap)
+        else:
+            self._header_wrap.original_widget = view_obj.header
+            self._footer_wrap.original_widget = view_obj.footer
         self.current_view = view_obj
         view_obj.switch_post_in_hook()
 
@@ -1707,7 +1991,7 @@ class TFlowApplication:
 
     def unhandled_input(self, key: str):
         """Handle q/Q key strokes."""
-        if key in ("q", "Q") and self.current_view != self.quit_view:
+        if key in ("q", "Q") and self.current_view is not self.quit_view:
             self.switch_view(self.quit_view)
 
     def flow_heartbeat(self):
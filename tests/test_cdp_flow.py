@@ -240,17 +240,14 @@ class TestCdpFlow(unittest.TestCase):
 
     @contextmanager
     def _create_tmp_smsrc(self, content: str):
-        """Create a fake .smsrc file"""
-        tmp_fh = None
+        """Create a fake .smsrc file (mkstemp gives it 0o600 permissions)"""
+        fd, tmp_name = tempfile.mkstemp(text=True)
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", encoding="utf-8", delete=False
-            ) as tmp_fh:
+            with os.fdopen(fd, mode="w", encoding="utf-8") as tmp_fh:
                 tmp_fh.write(content)
-            yield tmp_fh.name
+            yield tmp_name
         finally:
-            if tmp_fh:
-                os.remove(tmp_fh.name)
+            os.unlink(tmp_name)
 
     def test_sms_rc_reader(self):
         """Test the .smsrc file reader."""
@@ -265,7 +262,6 @@ class TestCdpFlow(unittest.TestCase):
                 assert SmsRcReader(rc_file).get_password("any_host", "any_user")
         # Real life...
         with self._create_tmp_smsrc(_SMSRC_EXAMPLE) as rc_file:
-            os.chmod(rc_file, 0o600)
             s_rc = SmsRcReader(rc_file)
             self.assertEqual(
                 s_rc.get_password("thehost.meteo.fr", "test"), "fancy_password"
@@ -170,6 +170,15 @@ class TestConf(unittest.TestCase):
                 double_keystroke_delay=toto
                 """
             ).double_keystroke_delay
+        self.assertEqual(TFlowClientConfig(conf_txt="").keystroke_debounce_delay, 0.08)
+        self.assertEqual(
+            TFlowClientConfig(
+                conf_txt="""[ui]
+                    keystroke_debounce_delay=0.1
+                    """
+            ).keystroke_debounce_delay,
+            0.1,
+        )
         self.assertEqual(
             TFlowClientConfig(conf_txt="").logviewer_command,
             ["vim", "-R", "-N", "{filename:s}"],
@@ -183,6 +192,20 @@ class TestConf(unittest.TestCase):
             ).logviewer_command,
             ["shell", "lexer", "was", "here"],
         )
+        self.assertTrue(TFlowClientConfig(conf_txt="").logviewer_needs_clear)
+        self.assertFalse(
+            TFlowClientConfig(
+                conf_txt="""[ui]
+                    logviewer_needs_clear=false
+                    """
+            ).logviewer_needs_clear
+        )
+        with self.assertRaises(ValueError):
+            assert TFlowClientConfig(
+                conf_txt="""[ui]
+                logviewer_needs_clear=None
+                """
+            ).logviewer_needs_clear
 
     def test_cdp_stuff(self):
         """Test SMS/CDP related config."""
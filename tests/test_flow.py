@@ -33,8 +33,8 @@
 Test the FlowNode class and related tools.
 """
 
-import time
 import unittest
+from unittest import mock
 
 from tflowclient.flow import FlowStatus, RootFlowNode
 from tflowclient.observer import Observer, Subject
@@ -101,8 +101,10 @@ class TestFlow(unittest.TestCase):
     def test_root_flow(self):
         """Test the FlowNode objects."""
         rfn = self._build_demo_flow()
-        time.sleep(0.05)
-        self.assertTrue(rfn.age > 0.05)
+        with mock.patch(
+            "tflowclient.flow.time.monotonic", return_value=rfn._c_time + 0.1
+        ):
+            self.assertTrue(rfn.age > 0.05)
         rfn_bis = self._build_demo_flow()
         rfn_bis_obs = FlowTestObserver()
         for cutoff in ("assim", "production"):
@@ -129,6 +131,10 @@ class TestFlow(unittest.TestCase):
         self.assertEqual(
             rfn["20200114"]["12"]["assim"].full_path, "A157/20200114/12/assim"
         )
+        self.assertIs(
+            rfn["20200114"]["12"]["assim"].full_path,
+            rfn["20200114"]["12"]["assim"].full_path,
+        )
         self.assertEqual(str(rfn["20200114"]["12"]), RES_STR_20200114_12)
         self.assertEqual(rfn, rfn_bis)
         self.assertNotEqual(rfn, "toto")
@@ -172,6 +178,65 @@ class TestFlow(unittest.TestCase):
             {id(rfn_bis["20200114"]["12"]["production"]["obsextract_surf"])},
         )
 
+    def test_first_expanded_leaf(self):
+        """The first expanded leaf follows the tree updates."""
+        rfn = self._build_demo_flow()
+        f_prod = rfn["20200114"]["12"]["production"]
+        self.assertIs(rfn.first_expanded_leaf(), f_prod["obsextract_surf"])
+        self.assertIsNone(rfn["20200114"]["00"].first_expanded_leaf())
+        # Adding a non-expanded node changes nothing
+        rfn["20200114"]["00"].add("late", FlowStatus.QUEUED)
+        self.assertIs(rfn.first_expanded_leaf(), f_prod["obsextract_surf"])
+        # Adding an expanded node in a previously folded family
+        f_late = rfn["20200114"]["00"]["production"].add("late", FlowStatus.ACTIVE)
+        self.assertIs(rfn["20200114"]["00"].first_expanded_leaf(), f_late)
+        self.assertIs(rfn.first_expanded_leaf(), f_late)
+        # Adding a child to the first expanded leaf
+        f_later = f_late.add("later", FlowStatus.SUBMITTED)
+        self.assertIs(rfn.first_expanded_leaf(), f_later)
+
+    def test_flagged_paths(self):
+        """Flagged nodes are looked for in the relevant sub-trees only."""
+        rfn = self._build_demo_flow()
+        self.assertListEqual(rfn.flagged_paths(), [])
+        rfn["20200114"]["12"]["assim"].flagged = True
+        rfn["20200114"]["00"]["assim"]["obsextract"].flagged = True
+        self.assertListEqual(
+            rfn.flagged_paths(),
+            ["20200114/00/assim/obsextract", "20200114/12/assim"],
+        )
+        self.assertListEqual(rfn["20200114"]["12"].flagged_paths(), ["assim"])
+        self.assertListEqual(rfn["20200114"]["12"]["assim"].flagged_paths(), [""])
+        rfn["20200114"]["12"]["assim"].flagged = False
+        self.assertListEqual(rfn["20200114"]["12"].flagged_paths(), [])
+        rfn.reset_flagged()
+        self.assertListEqual(rfn.flagged_paths(), [])
+        self.assertFalse(rfn["20200114"]["00"]["assim"]["obsextract"].flagged)
+        rfn["20200114"]["12"].flag_status(FlowStatus.ACTIVE)
+        self.assertListEqual(
+            rfn.flagged_paths(), ["20200114/12/production/obsextract_surf"]
+        )
+        rfn.reset_flagged()
+        rfn.flag_status(FlowStatus.COMPLETE)
+        self.assertListEqual(
+            rfn.flagged_paths(),
+            ["20200114/00/production/obsextract", "20200114/00/assim/obsextract"],
+        )
+
+    def test_reset_user_expanded(self):
+        """Reset the user_expanded property of a whole tree."""
+        rfn = self._build_demo_flow()
+        rfn["20200114"]["00"].user_expanded = True
+        rfn["20200114"]["12"]["assim"].user_expanded = False
+        self.assertEqual(len(rfn.user_expanded_paths()), 2)
+        self.assertTrue(rfn["20200114"]["00"].effective_expanded)
+        self.assertFalse(rfn["20200114"]["12"]["assim"].effective_expanded)
+        rfn.reset_user_expanded()
+        self.assertDictEqual(rfn.user_expanded_paths(), {})
+        self.assertIsNone(rfn["20200114"]["00"].user_expanded)
+        self.assertFalse(rfn["20200114"]["00"].effective_expanded)
+        self.assertTrue(rfn["20200114"]["12"]["assim"].effective_expanded)
+
     @staticmethod
     def _rfn_update(rfn: RootFlowNode, new_rfn: RootFlowNode) -> RootFlowNode:
         if rfn.focused is not None:
@@ -35,6 +35,7 @@ Test the log gateway classes.
 
 from datetime import datetime
 import os
+import socket
 import unittest
 
 from tflowclient.logs_gateway import get_logs_gateway, LogsGateway
@@ -84,16 +85,19 @@ class TestLogsGateway(unittest.TestCase):
 
     def test_cdp_gateway(self):
         """Test the SMS log gateway."""
-        # Just test the ping method...
-        sms_g = get_logs_gateway(
-            kind="sms_log_svr",
-            host="not_existing.for.sure.fr",
-            port=12345,
-            paths=[
-                "/tmp",
-            ],
-        )
-        self.assertFalse(sms_g.ping(connect_timeout=0.2))
+        # Just test the ping method... (on a bound but not listening loopback
+        # port: the connection is refused right away, without any DNS lookup)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as closed_port:
+            closed_port.bind(("127.0.0.1", 0))
+            sms_g = get_logs_gateway(
+                kind="sms_log_svr",
+                host="127.0.0.1",
+                port=closed_port.getsockname()[1],
+                paths=[
+                    "/tmp",
+                ],
+            )
+            self.assertFalse(sms_g.ping(connect_timeout=0.2))
 
 
 if __name__ == "__main__":